@@ -4,7 +4,7 @@
 import pygame
 import sys
 import random
-import math
+import numpy as np
 
 # --- Constants ---
 SCREEN_WIDTH = 800
@@ -37,85 +37,204 @@ def load_image(path, fallback_color=(50, 50, 50)):
         return surface
 
 def load_mask(path, fallback_color=(255, 255, 255)):
+    """Load a mask as its terrain image (darker pixels, brightness < 200), a W x H bool array"""
     try:
-        return pygame.image.load(path).convert()
+        surface = pygame.image.load(path).convert()
     except:
         surface = pygame.Surface((800, 600))
         surface.fill(fallback_color)
-        return surface
+    # Read every pixel under a single surface lock, summing the channels straight into uint16
+    # without a widened copy; mean < 200 is sum < 600. The surface itself is never needed again
+    pixels = pygame.surfarray.pixels3d(surface)
+    terrain = pixels.sum(axis=2, dtype=np.uint16) < 600
+    del pixels  # release the surface lock
+    return terrain
 
 # Parallax layers for weather
 background_far = load_image(f"assets/background_far_{weather.lower()}.png", (135, 206, 235))
 background_mid = load_image(f"assets/background_mid_{weather.lower()}.png", (100, 155, 100))
 
-background_mid_mask = load_mask("assets/mid_mask.png")
-background_far_mask = load_mask("assets/far_mask.png")
-
-haze_layer = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-haze_layer.fill((200, 200, 255, 30))  # bluish, 30 alpha
+def fit_to_screen(image):
+    """Stretch a background no wider than the screen to fill it, once instead of every frame"""
+    if image.get_width() <= SCREEN_WIDTH:
+        return pygame.transform.scale(image, (SCREEN_WIDTH, SCREEN_HEIGHT))
+    return image
+
+def flatten_image(image):
+    """Composite an image onto the black clear colour as an opaque surface, so it blits as a plain copy"""
+    flat = pygame.Surface(image.get_size()).convert()
+    flat.fill((0, 0, 0))
+    flat.blit(image, (0, 0))
+    return flat
+
+# The far layer is the backmost one and always covers the whole screen
+background_far = flatten_image(fit_to_screen(background_far))
+background_mid = fit_to_screen(background_mid)
+
+def compute_terrain_top(terrain):
+    """Topmost terrain row for every mask column, mask height if the column has none"""
+    top = terrain.argmax(axis=1).astype(np.int32)
+    # argmax is 0 for columns without terrain too, tell them apart with one read per column
+    top[~terrain[np.arange(len(top)), top]] = terrain.shape[1]
+    return top
+
+def load_terrain(path):
+    """Load a mask as its terrain lookup table and mask size, the terrain image is not kept"""
+    terrain = load_mask(path)
+    return compute_terrain_top(terrain), terrain.shape
+
+# Terrain lookup tables, built once since the masks never change, and mask sizes keyed by layer
+mask_sizes = {}
+mid_top, mask_sizes['mid'] = load_terrain("assets/mid_mask.png")
+far_top, mask_sizes['far'] = load_terrain("assets/far_mask.png")
+
+HAZE_COLOR = (200, 200, 255)  # bluish
+HAZE_ALPHA = 30
+
+def apply_haze(surface):
+    """Blend the haze into a surface's colour in place, keeping its per-pixel alpha"""
+    pixels = pygame.surfarray.pixels3d(surface)
+    hazed = pixels.astype(np.uint16) * (255 - HAZE_ALPHA) + np.array(HAZE_COLOR, np.uint16) * HAZE_ALPHA
+    pixels[...] = (hazed + 127) // 255
+    del pixels  # release the surface lock
 
 # Overlay and sprites
 fire_image = load_image("assets/fire.png", (255, 100, 0))
 smoke_image = load_image("assets/smoke.png", (128, 128, 128))
 window_overlay = load_image("assets/osborne_overlay.png", (0, 0, 0, 0))
 crosshair_image = load_image("assets/crosshair.png", (255, 255, 255))
+_CROSS_OFF = (-crosshair_image.get_width()//2, -crosshair_image.get_height()//2)
+
+# Rendered info text keyed by (azimuth, declination), the weather never changes during a game
+_TEXT_CACHE = {}
+
+def scale_image(image, scale):
+    return pygame.transform.scale(
+        image,
+        (int(image.get_width() * scale),
+         int(image.get_height() * scale))
+    )
+
+# Fire sprites scaled once per layer and shared by every fire (far fires are drawn at half size)
+FIRE_SURF = {'far': scale_image(fire_image, 0.5), 'mid': fire_image}
+SMOKE_SURF = {'far': scale_image(smoke_image, 0.5), 'mid': smoke_image}
+
+# The far layer sits behind the haze. Blending is linear, so hazing the background and the
+# far sprites once gives the same picture as blitting a haze layer over them every frame
+apply_haze(background_far)
+apply_haze(FIRE_SURF['far'])
+apply_haze(SMOKE_SURF['far'])
 
 # --- Classes ---
-class Fire(pygame.sprite.Sprite):
-    def __init__(self, azimuth, distance, base_lifetime):
-        super().__init__()
-        self.azimuth = azimuth
-        self.distance = distance
-        self.layer = 'far' if distance > 150 else 'mid'
-        self.reported = False
+BUCKET_WIDTH = 30  # degrees of azimuth per fire bucket
+
+class FireArray:
+    """Fires of one layer stored as struct-of-arrays, one slot per fire, so culling runs as NumPy passes"""
+    COLUMNS = {
+        'azimuth': np.float32,
+        'distance': np.float32,
+        'spawn_time': np.float32,
+        'lifetime': np.float32,
+        'terrain_offset': np.int32,
+        'reported': np.bool_,
+        'alive': np.bool_,
+    }
+
+    def __init__(self, layer, capacity=64):
+        self.layer = layer
+        for name, dtype in self.COLUMNS.items():
+            setattr(self, name, np.zeros(capacity, dtype))
+        # Slot indices bucketed by azimuth, so only buckets overlapping the view are tested
+        self.buckets = [[] for _ in range(360 // BUCKET_WIDTH)]
+        # Bumped whenever a fire is added or removed, invalidating the cached screen positions
+        self.version = 0
+        self._screen_cache = (None, None)
+        self._terrain_cache = (None, None)
+
+    def grow(self):
+        """Double the capacity, keeping existing slots"""
+        for name in self.COLUMNS:
+            column = getattr(self, name)
+            setattr(self, name, np.concatenate([column, np.zeros_like(column)]))
+
+    def add(self, azimuth, distance, base_lifetime, now):
+        """Write a new fire into the next free slot and return the slot index"""
+        free = np.flatnonzero(~self.alive)
+        if len(free) == 0:
+            self.grow()
+            free = np.flatnonzero(~self.alive)
+        i = free[0]
+
+        self.azimuth[i] = azimuth
+        self.distance[i] = distance
+        self.reported[i] = False
         
         # Generate random terrain offset once at creation (positive = lower on hillside)
-        self.terrain_offset = random.randint(0, 80)  # 0-80 pixels down from hilltop
-        
-        self.base_image = fire_image
-        self.smoke_image = smoke_image
-
-        # Scale based on layer
-        if self.layer == 'far':
-            scale = 0.5
-        else:
-            scale = 1.0
-            
-        self.image = pygame.transform.scale(
-            self.base_image, 
-            (int(self.base_image.get_width() * scale),
-             int(self.base_image.get_height() * scale))
-        )
-        self.smoke = pygame.transform.scale(
-            self.smoke_image, 
-            (int(self.smoke_image.get_width() * scale),
-             int(self.smoke_image.get_height() * scale))
-        )
+        self.terrain_offset[i] = random.randint(0, 80)  # 0-80 pixels down from hilltop
 
         # Weather effects on lifetime
         if weather == "Rainy":
-            self.lifetime = base_lifetime * 0.5
+            self.lifetime[i] = base_lifetime * 0.5
         elif weather == "Windy":
-            self.lifetime = base_lifetime * 1.5
+            self.lifetime[i] = base_lifetime * 1.5
         elif weather == "Hot":
-            self.lifetime = base_lifetime * 2.0
+            self.lifetime[i] = base_lifetime * 2.0
         else:
-            self.lifetime = base_lifetime
-
-        self.spawn_time = pygame.time.get_ticks()
-
-    def is_expired(self):
-        return pygame.time.get_ticks() - self.spawn_time > self.lifetime
-
-    def get_terrain_height_at_screen_x(self, screen_x, mask, player_azimuth):
-        """Get the terrain height at a specific screen X position"""
-        mask_width = mask.get_width()
-        mask_height = mask.get_height()
+            self.lifetime[i] = base_lifetime
+
+        self.spawn_time[i] = now
+        self.alive[i] = True
+        self.buckets[int(azimuth) // BUCKET_WIDTH].append(i)
+        self.version += 1
+        return i
+
+    def is_expired(self, now):
+        """Mask of slots whose fire is dead or has burned past its lifetime"""
+        return ~self.alive | (now - self.spawn_time > self.lifetime)
+
+    def remove_expired(self, now):
+        expired = self.alive & self.is_expired(now)
+        if expired.any():
+            self.alive &= ~expired
+            self.version += 1
+
+    def candidates(self, player_azimuth):
+        """Live slots in the azimuth buckets overlapping the field of view"""
+        first = (player_azimuth - FOV // 2) // BUCKET_WIDTH
+        last = (player_azimuth + FOV // 2) // BUCKET_WIDTH
+        slots = []
+        for b in range(first, last + 1):
+            b %= len(self.buckets)
+            bucket = self.buckets[b]
+            # Expired fires and reused slots leave stale entries behind, drop them while scanning
+            bucket[:] = [i for i in dict.fromkeys(bucket)
+                         if self.alive[i] and int(self.azimuth[i]) // BUCKET_WIDTH == b]
+            slots.extend(bucket)
+        return np.array(slots, dtype=np.intp)
+
+    def visible(self, player_azimuth):
+        """Indices of live fires inside the field of view, oldest first"""
+        indices = self.candidates(player_azimuth)
+        relative = (self.azimuth[indices] - player_azimuth + 180) % 360 - 180
+        indices = indices[np.abs(relative) <= FOV / 2]
+        # Slots are reused, so order by spawn time to keep newer fires drawn on top
+        return indices[np.argsort(self.spawn_time[indices], kind='stable')]
+
+    def get_terrain_screen_y(self, player_azimuth):
+        """Terrain screen height under every screen column for this view, rebuilt only when the view turns"""
+        cached_azimuth, table = self._terrain_cache
+        if cached_azimuth == player_azimuth:
+            return table
+
+        terrain_top = far_top if self.layer == 'far' else mid_top
+        mask_width, mask_height = mask_sizes[self.layer]
+        # Fires at the right edge of the view land on x == SCREEN_WIDTH
+        screen_x = np.arange(SCREEN_WIDTH + 1)
         
         # Handle narrow masks (same logic as draw_parallax_layer)
         if mask_width <= SCREEN_WIDTH:
             # For narrow masks, direct screen-to-mask mapping
-            mask_x = int((screen_x / SCREEN_WIDTH) * mask_width) % mask_width
+            mask_x = (screen_x / SCREEN_WIDTH * mask_width).astype(np.int32) % mask_width
         else:
             # For wide masks, calculate which part of the mask is visible at this screen position
             # This is the inverse of the parallax drawing logic
@@ -124,67 +243,82 @@ class Fire(pygame.sprite.Sprite):
             # Convert screen X to mask position, accounting for current parallax offset
             mask_x = (parallax_offset + screen_x) % mask_width
         
-        # Scan from top to bottom to find the FIRST terrain pixel
-        for y in range(mask_height):
-            try:
-                pixel = mask.get_at((mask_x, y))
-                # Check if this is a terrain pixel
-                brightness = (pixel[0] + pixel[1] + pixel[2]) / 3
-                if brightness < 200:
-                    # Convert mask Y to screen Y and add the fire's terrain offset
-                    base_screen_y = int((y / mask_height) * SCREEN_HEIGHT)
-                    screen_y = base_screen_y + self.terrain_offset
-                    return screen_y
-            except IndexError:
-                continue
-        
-        # If no terrain found, return fallback based on layer (with offset)
-        if self.layer == 'far':
-            return int(SCREEN_HEIGHT * 0.7) + self.terrain_offset
-        else:
-            return int(SCREEN_HEIGHT * 0.85) + self.terrain_offset
+        # Look up the FIRST terrain pixel from the top in each column
+        y = terrain_top[mask_x]
+
+        # Convert mask Y to screen Y, with a fallback based on layer where no terrain is found
+        fallback = int(SCREEN_HEIGHT * 0.7) if self.layer == 'far' else int(SCREEN_HEIGHT * 0.85)
+        table = np.where(y < mask_height, (y / mask_height * SCREEN_HEIGHT).astype(np.int32), fallback)
+        self._terrain_cache = (player_azimuth, table)
+        return table
 
-    def get_screen_pos(self, player_azimuth):
-        """Get the screen position of this fire relative to player view"""
+    def get_terrain_height_at_screen_x(self, indices, screen_x, player_azimuth):
+        """Get the terrain height under fires at their screen X positions"""
+        return self.get_terrain_screen_y(player_azimuth)[screen_x] + self.terrain_offset[indices]
+
+    def get_screen_pos(self, indices, player_azimuth):
+        """Get the screen positions of fires in the field of view relative to player view"""
         # Calculate relative angle to player's view
-        relative_angle = (self.azimuth - player_azimuth + 180) % 360 - 180
-        
-        # Check if fire is within field of view
-        if abs(relative_angle) > FOV / 2:
-            return None
+        relative_angle = (self.azimuth[indices].astype(np.int32) - player_azimuth + 180) % 360 - 180
 
         # Calculate screen x position based on relative angle
-        x = int((relative_angle + FOV / 2) / FOV * SCREEN_WIDTH)
+        x = ((relative_angle + FOV / 2) / FOV * SCREEN_WIDTH).astype(np.int32)
         
-        # Get terrain height at this screen position (not azimuth position)
-        mask = background_far_mask if self.layer == 'far' else background_mid_mask
-        screen_y = self.get_terrain_height_at_screen_x(x, mask, player_azimuth)
+        # Get terrain height at these screen positions (not azimuth positions)
+        y = self.get_terrain_height_at_screen_x(indices, x, player_azimuth)
         
-        return x, screen_y
+        return x, y
+
+    def get_visible_screen_pos(self, player_azimuth):
+        """Indices and screen positions of visible fires, cached until the view turns or fires change"""
+        key = (player_azimuth, self.version)
+        cached_key, cached = self._screen_cache
+        if cached_key == key:
+            return cached
+
+        indices = self.visible(player_azimuth)
+        x, y = self.get_screen_pos(indices, player_azimuth)
+        self._screen_cache = (key, (indices, x, y))
+        return indices, x, y
+
+    def find_hit(self, cross_x, cross_y, cross_azimuth, player_azimuth):
+        """Index of the oldest unreported fire under the crosshair, or None"""
+        # Hit-test every fire in view at once
+        indices, fire_x, fire_y = self.get_visible_screen_pos(player_azimuth)
+
+        angle_diff = np.abs((self.azimuth[indices].astype(np.int32) - cross_azimuth + 180) % 360 - 180)
+        distance_sq = (fire_x - cross_x)**2 + (fire_y - cross_y)**2
+
+        hits = indices[~self.reported[indices] & (angle_diff < 15) & (distance_sq < 50**2)]
+        return hits[0] if len(hits) else None
 
     def draw(self, surface, player_azimuth):
-        pos = self.get_screen_pos(player_azimuth)
-        if pos:
-            x, y = pos
-            
-            # Position fire sprite on the terrain surface
-            fire_rect = self.image.get_rect()
-            fire_rect.centerx = x
-            fire_rect.bottom = y  # Bottom of fire sits on terrain
-            
-            # Draw fire
-            surface.blit(self.image, fire_rect)
-            
-            # Position smoke above the fire
-            smoke_rect = self.smoke.get_rect()
-            smoke_rect.centerx = x
-            smoke_rect.bottom = fire_rect.top - 5  # Small gap between fire and smoke
-            
-            # Draw smoke
-            surface.blit(self.smoke, smoke_rect)
+        """Draw the visible fires"""
+        image = FIRE_SURF[self.layer]
+        smoke = SMOKE_SURF[self.layer]
+        fire_width, fire_height = image.get_size()
+        smoke_width, smoke_height = smoke.get_size()
+
+        _, x, y = self.get_visible_screen_pos(player_azimuth)
+
+        # Position fire sprites on the terrain surface (bottom of fire sits on terrain)
+        fire_left = x - fire_width // 2
+        fire_top = y - fire_height
+
+        # Position smoke above the fire, with a small gap between them
+        smoke_left = x - smoke_width // 2
+        smoke_top = fire_top - 5 - smoke_height
+
+        # Queue each fire and then its smoke, and hand them all to pygame in a single call
+        blit_list = []
+        for fire_pos, smoke_pos in zip(zip(fire_left.tolist(), fire_top.tolist()),
+                                       zip(smoke_left.tolist(), smoke_top.tolist())):
+            blit_list.append((image, fire_pos))
+            blit_list.append((smoke, smoke_pos))
+        surface.blits(blit_list, doreturn=False)
 
 # --- Game State ---
-fires = []
+fires = {'far': FireArray('far'), 'mid': FireArray('mid')}
 reports = []
 player_azimuth = 0
 osborne_open = False
@@ -195,142 +329,116 @@ next_fire_time = pygame.time.get_ticks() + random.randint(3000, 6000)
 def draw_parallax_layer(image, scroll_factor):
     bg_width = image.get_width()
     if bg_width <= SCREEN_WIDTH:
-        screen.blit(pygame.transform.scale(image, (SCREEN_WIDTH, SCREEN_HEIGHT)), (0, 0))
+        # Already stretched to the screen at load
+        screen.blit(image, (0, 0))
         return
 
     offset = int((player_azimuth / 360) * bg_width * scroll_factor) % bg_width
-    screen.blit(image, (-offset, 0))
-    screen.blit(image, (-offset + bg_width, 0))
-
-def has_terrain_at_azimuth(azimuth, mask, player_azimuth=0):
-    """Check if there's terrain at a specific azimuth in the given mask"""
-    mask_width = mask.get_width()
-    mask_height = mask.get_height()
+    # Copy only the visible slice, plus the wrapped-around slice from the start of the image at the seam
+    visible_width = min(bg_width - offset, SCREEN_WIDTH)
+    screen.blit(image, (0, 0), (offset, 0, visible_width, SCREEN_HEIGHT))
+    if visible_width < SCREEN_WIDTH:
+        screen.blit(image, (visible_width, 0), (0, 0, SCREEN_WIDTH - visible_width, SCREEN_HEIGHT))
+
+def has_terrain_at_azimuth(azimuths, mask_size, terrain_top, player_azimuth=0):
+    """Check which of the given azimuths have terrain in the mask with the given size and LUT"""
+    azimuths = np.asarray(azimuths)
+    mask_width, mask_height = mask_size
     
-    # Handle narrow masks vs wide masks (same logic as get_terrain_height_at_azimuth)
+    # Handle narrow masks vs wide masks (same logic as get_terrain_height_at_screen_x)
     if mask_width <= SCREEN_WIDTH:
         # For narrow masks, use direct azimuth mapping
-        x = int((azimuth / 360) * mask_width) % mask_width
+        x = (azimuths / 360 * mask_width).astype(np.int32) % mask_width
     else:
         # For wide masks, account for parallax offset
         parallax_offset = int((player_azimuth / 360) * mask_width * 1) % mask_width
-        base_x = int((azimuth / 360) * mask_width)
+        base_x = (azimuths / 360 * mask_width).astype(np.int32)
         x = (base_x + parallax_offset) % mask_width
     
-    # Scan from top to bottom looking for terrain
-    for y in range(mask_height):
-        try:
-            pixel = mask.get_at((x, y))
-            # More flexible terrain detection
-            brightness = (pixel[0] + pixel[1] + pixel[2]) / 3
-            if brightness < 200:  # Found terrain (darker pixel)
-                return True
-        except IndexError:
-            continue
-    
-    return False
+    # The column has terrain if its topmost terrain row lies inside the mask
+    return terrain_top[x] < mask_height
+
+# Whole-degree azimuths with terrain to spawn fires on, so spawning never has to retry
+MID_AZIMUTHS = np.flatnonzero(has_terrain_at_azimuth(np.arange(360), mask_sizes['mid'], mid_top))
+FAR_AZIMUTHS = np.flatnonzero(has_terrain_at_azimuth(np.arange(360), mask_sizes['far'], far_top))
 
-def generate_fire():
+def generate_fire(now):
     """Generate a new fire at a random location with terrain"""
-    max_attempts = 20  # Increase attempts to find terrain
-    attempts = 0
-    
-    while attempts < max_attempts:
-        azimuth = random.randint(0, 359)
-        distance = random.choice([100, 200])  # 100 = mid, 200 = far
-        
-        # Choose correct mask for terrain verification
-        mask = background_mid_mask if distance == 100 else background_far_mask
-        
-        # Check if there's terrain at this azimuth
-        if has_terrain_at_azimuth(azimuth, mask):
-            base_lifetime = random.randint(10000, 50000)
-            fire = Fire(azimuth, distance, base_lifetime)
-            
-            fires.append(fire)
-            layer_name = "far" if distance > 150 else "mid"
-            # print(f"Generated {layer_name} fire at azimuth {azimuth}°")
-            return
-        
-        attempts += 1
-    
-    print(f"Could not find suitable terrain after {max_attempts} attempts")
+    distance = random.choice([100, 200])  # 100 = mid, 200 = far
+    layer_name = "far" if distance > 150 else "mid"
+    valid_azimuths = MID_AZIMUTHS if distance == 100 else FAR_AZIMUTHS
+
+    if len(valid_azimuths) == 0:
+        print(f"Could not find suitable terrain for a {layer_name} fire")
+        return
+
+    azimuth = int(random.choice(valid_azimuths))
+    base_lifetime = random.randint(10000, 50000)
+    fires[layer_name].add(azimuth, distance, base_lifetime, now)
+    # print(f"Generated {layer_name} fire at azimuth {azimuth}°")
 
 def draw_far():
     draw_parallax_layer(background_far, 1)
 
     # Draw far layer fires
-    fires_to_remove = []
-    for fire in fires:
-        if fire.layer == 'far':
-            if fire.is_expired():
-                fires_to_remove.append(fire)
-            else:
-                fire.draw(screen, player_azimuth)
-    
-    # Remove expired fires
-    for fire in fires_to_remove:
-        fires.remove(fire)
-    
-    screen.blit(haze_layer, (0, 0))
+    fires['far'].draw(screen, player_azimuth)
 
 def draw_mid():
     draw_parallax_layer(background_mid, 1)
 
     # Draw mid layer fires
-    fires_to_remove = []
-    for fire in fires:
-        if fire.layer == 'mid':
-            if fire.is_expired():
-                fires_to_remove.append(fire)
-            else:
-                fire.draw(screen, player_azimuth)
-    
-    # Remove expired fires
-    for fire in fires_to_remove:
-        fires.remove(fire)
+    fires['mid'].draw(screen, player_azimuth)
 
 def draw_osborne_ui():
     screen.blit(window_overlay, (0, 0))
-    screen.blit(crosshair_image, (crosshair_pos[0] - crosshair_image.get_width()//2, 
-                                  crosshair_pos[1] - crosshair_image.get_height()//2))
+    screen.blit(crosshair_image, (crosshair_pos[0] + _CROSS_OFF[0], crosshair_pos[1] + _CROSS_OFF[1]))
     
     cross_azimuth = int((crosshair_pos[0] / SCREEN_WIDTH) * FOV + (player_azimuth - FOV // 2)) % 360
     cross_elevation = int((300 - crosshair_pos[1]) / (600 / 90))
     
-    info = f"Target Azimuth: {cross_azimuth}°, Declination: {cross_elevation}°, Weather: {weather}"
-    text = font.render(info, True, WHITE)
+    key = (cross_azimuth, cross_elevation)
+    text = _TEXT_CACHE.get(key)
+    if text is None:
+        if len(_TEXT_CACHE) > 256:
+            _TEXT_CACHE.clear()
+        info = f"Target Azimuth: {cross_azimuth}°, Declination: {cross_elevation}°, Weather: {weather}"
+        text = _TEXT_CACHE[key] = font.render(info, True, WHITE)
     screen.blit(text, (20, SCREEN_HEIGHT - 30))
 
 def check_report():
     cross_azimuth = int((crosshair_pos[0] / SCREEN_WIDTH) * FOV + (player_azimuth - FOV // 2)) % 360
     cross_x, cross_y = crosshair_pos
 
-    for fire in fires:
-        pos = fire.get_screen_pos(player_azimuth)
-        if not pos:
-            continue
-        fire_x, fire_y = pos
+    # Report the oldest fire hit on either layer
+    hits = []
+    for layer_fires in fires.values():
+        i = layer_fires.find_hit(cross_x, cross_y, cross_azimuth, player_azimuth)
+        if i is not None:
+            hits.append((layer_fires.spawn_time[i], layer_fires, i))
 
-        angle_diff = abs((fire.azimuth - cross_azimuth + 180) % 360 - 180)
-        distance_diff = math.sqrt((fire_x - cross_x)**2 + (fire_y - cross_y)**2)
-        
-        if not fire.reported and angle_diff < 15 and distance_diff < 50:
-            fire.reported = True
-            reports.append((cross_azimuth, cross_y))
-            fire_declination = int((300-cross_y)/(600/90))
-            print(f"Fire reported at Azimuth {cross_azimuth}°, Declination {fire_declination}°")
-            break
+    if hits:
+        _, layer_fires, i = min(hits, key=lambda hit: hit[0])
+        layer_fires.reported[i] = True
+        reports.append((cross_azimuth, cross_y))
+        fire_declination = int((300-cross_y)/(600/90))
+        print(f"Fire reported at Azimuth {cross_azimuth}°, Declination {fire_declination}°")
 
 # --- Main Loop ---
-running = True
-print(f"Current weather: {weather}")
+# Bound once so the per-frame code skips the module attribute lookups
+_get_ticks = pygame.time.get_ticks
+_events = pygame.event.get
+_keys = pygame.key.get_pressed
+_flip = pygame.display.flip
 
-while running:
-    dt = clock.tick(FPS)
-    current_time = pygame.time.get_ticks()
+def update(dt, current_time):
+    """Handle input, move the view and spawn fires for one frame"""
+    global running, osborne_open, crosshair_pos, player_azimuth, next_fire_time
+
+    # Remove expired fires once per frame, before they can be reported or drawn
+    for layer_fires in fires.values():
+        layer_fires.remove_expired(current_time)
 
-    for event in pygame.event.get():
+    for event in _events():
         if event.type == pygame.QUIT:
             running = False
         elif event.type == pygame.KEYDOWN:
@@ -341,7 +449,7 @@ while running:
         elif event.type == pygame.MOUSEMOTION and osborne_open:
             crosshair_pos = list(pygame.mouse.get_pos())
 
-    keys = pygame.key.get_pressed()
+    keys = _keys()
     if keys[pygame.K_LEFT]:
         player_azimuth = (player_azimuth - 1) % 360
     if keys[pygame.K_RIGHT]:
@@ -350,7 +458,7 @@ while running:
     # Generate new fires
     if current_time >= next_fire_time:
         # print(f"Attempting to generate fire at time {current_time}")
-        generate_fire()
+        generate_fire(current_time)
         # Set next fire time (reduced for testing - change back to longer intervals)
         waiting_time_scale = 1
         if weather == 'Hot':
@@ -361,16 +469,25 @@ while running:
             waiting_time_scale = 0.5
         next_fire_time = current_time + random.randint(4000,8000)/waiting_time_scale  # Change to random.randint(4000, 8000) for normal gameplay
         print("New fire located in the area, look out!")
-    
-    # Draw layers in correct order
-    screen.fill((0, 0, 0))  # Clear screen
-    draw_far()
+
+def render():
+    """Draw layers in correct order"""
+    draw_far()  # Opaque and full-screen, so it also clears the screen
     draw_mid()
 
     if osborne_open:
         draw_osborne_ui()
 
-    pygame.display.flip()
+    _flip()
+
+running = True
+print(f"Current weather: {weather}")
+
+while running:
+    dt = clock.tick(FPS)
+    now = _get_ticks()  # sampled once per frame
+    update(dt, now)
+    render()
 
 pygame.quit()
 sys.exit()
\ No newline at end of file